@@ -9,72 +9,109 @@ Attempted solution: I developed a miniature web app using Streamlit that has an
 develop a clear understanding of the working and logic, using buttons and click options to carry the audience along through the whole process. The app gives a live demonstration of how the mechanism adapts
 to different inputs, with the final code changing as the user interacts with the different options available on the app. 
 
-Libraries used: Primarily streamlit, with assistance from random, os, datetime, sys and subprocess. 
+Libraries used: Primarily streamlit (1.49 or newer), with assistance from pandas, secrets and datetime. 
 
 Updates in consideration: An AI voice-to-text converter that allows the user to simple speak the combination that they want displayed. The converter interprets the voice, converts it to text and passes 
 it along to another (chatbot?) that then interprets the text input, adjusts the options and clickboxes accordingly, and finally outputs the expected ID code.
 '''
 
 import streamlit as st
-import subprocess
-import sys
-import os
-import random
+import secrets
+import pandas as pd
 from datetime import datetime
+from types import MappingProxyType
 
 # Initialize session state for profile history (moved to top)
-if 'profile_history' not in st.session_state:
-    st.session_state.profile_history = []
+# History is stored as parallel lists: timestamp, provider, profile, V2X mask, access mask
+HISTORY_KEYS = ('hist_ts', 'hist_oem', 'hist_profile', 'hist_v2x_mask', 'hist_access_mask')
 
-def generate_profile(its, v2x_modes_dict, access_modes_dict):
+for key in HISTORY_KEYS:
+    if key not in st.session_state:
+        st.session_state[key] = []
+
+# Mode names indexed by bit position (position 0 is the most significant bit of the mask)
+V2X_NAMES = ('V2V', 'V2I', 'V2N', 'V2P', 'V2G', 'V2D', 'V2H', 'RES')
+ACCESS_NAMES = (
+    'READ_CAN', 'WRITE_CAN', 'BRAKE_CTRL', 'STEER_CTRL',
+    'POWERTRAIN_CTRL', 'ADAS_ALERTS', 'SENSOR_FEED', 'VIDEO_STREAM',
+    'AUDIO_STREAM', 'NAV_DISPLAY', 'HMI_NOTIF', 'TELEMETRY_TX',
+    'OTA_UPDATE', 'DIAGNOSTICS', 'HVAC_CTRL', 'LIGHTS_CTRL'
+)
+
+@st.cache_resource
+def _tables():
     """
-    Generate vehicle profile directly without subprocess
-    
-    Args:
-        its: String - ITS provider name
-        v2x_modes_dict: Dict - V2X mode selections {mode_name: boolean}
-        access_modes_dict: Dict - Access mode selections {mode_name: boolean}
+    Build the provider and bit-position lookup tables once per process
     
     Returns:
-        String - Generated profile in format: ITS_CODE:V2X_PROFILE:HARDWARE_ID:ACCESS_SCOPE
+        Tuple - (ITS_LIST, V2X_BITS, ACCESS_BITS) as read-only mappings
     """
     
     its_list = {"Siemens": 1126, "Harman": 2852, "Schneider": 4389, "TATA": 1142, 
                "UMTC": 5374, "Huawei": 6782, "Kapsch": 3758, "Hitachi": 6820, 
                "GMV": 9903, "NEC": 1096}
     
-    its_code = its_list[its]
+    v2x_bits = {name: bit for bit, name in enumerate(V2X_NAMES)}
     
-    # V2X Profile Generation
-    v2x_profile_bits = {"V2V":0, "V2I":1, "V2N":2, "V2P":3, "V2G":4, "V2D":5, "V2H":6, "RES":7}
-    v2x_profile = ['0']*8
+    access_bits = {name: bit for bit, name in enumerate(ACCESS_NAMES)}
     
-    for mode_name, is_enabled in v2x_modes_dict.items():
-        if is_enabled and mode_name in v2x_profile_bits:
-            v2x_profile[v2x_profile_bits[mode_name]] = "1"
+    return (MappingProxyType(its_list), MappingProxyType(v2x_bits), MappingProxyType(access_bits))
+
+@st.cache_resource
+def _expansions():
+    """
+    Precompute the enabled names for every byte value once per process
     
-    v2x_hex = f"{int(''.join(v2x_profile), 2):04X}"[2:]
+    Returns:
+        Tuple - (V2X_EXPANSION, ACCESS_HI_EXPANSION, ACCESS_LO_EXPANSION), each indexed by
+        an 8-bit value; the access mask splits into its high and low bytes
+    """
     
-    # Access Scope Generation
-    access_scope_bits = {
-        "READ_CAN":0, "WRITE_CAN":1, "BRAKE_CTRL":2, "STEER_CTRL":3,
-        "POWERTRAIN_CTRL":4, "ADAS_ALERTS":5, "SENSOR_FEED":6, "VIDEO_STREAM":7,
-        "AUDIO_STREAM":8, "NAV_DISPLAY":9, "HMI_NOTIF":10, "TELEMETRY_TX":11,
-        "OTA_UPDATE":12, "DIAGNOSTICS":13, "HVAC_CTRL":14, "LIGHTS_CTRL":15
-    }
+    def by_byte(names):
+        return tuple(tuple(names[i] for i in range(8) if byte >> (7 - i) & 1) for byte in range(256))
     
-    access_scope = ['0'] * 16
+    return (by_byte(V2X_NAMES), by_byte(ACCESS_NAMES[:8]), by_byte(ACCESS_NAMES[8:]))
+
+@st.cache_resource
+def _rng():
+    """
+    Shared OS-backed random source for hardware IDs, created once per process
+    """
+    return secrets.SystemRandom()
+
+@st.cache_data(max_entries=1024)
+def encode_prefix(its, v2x_int, access_int):
+    """
+    Encode the deterministic part of a profile, leaving the hardware ID slot empty
     
-    for mode_name, is_enabled in access_modes_dict.items():
-        if is_enabled and mode_name in access_scope_bits:
-            access_scope[access_scope_bits[mode_name]] = "1"
+    Args:
+        its: String - ITS provider name
+        v2x_int: Int - 8-bit V2X mode mask
+        access_int: Int - 16-bit access scope mask
     
-    access_hex = f"{int(''.join(access_scope), 2):06X}"[2:]
+    Returns:
+        String - Encoded profile in format: ITS_CODE:V2X_PROFILE::ACCESS_SCOPE
+    """
     
-    # Generate random hardware ID
-    hardware_ID = f"{random.getrandbits(32):08X}"
+    ITS_LIST = _tables()[0]
     
-    return f'{its_code}:{v2x_hex}:{hardware_ID}:{access_hex}'
+    return f"{ITS_LIST[its]}:{v2x_int:02X}::{access_int:04X}"
+
+def generate_profile(its, v2x_int, access_int):
+    """
+    Generate vehicle profile directly without subprocess
+    
+    Args:
+        its: String - ITS provider name
+        v2x_int: Int - 8-bit V2X mode mask
+        access_int: Int - 16-bit access scope mask
+    
+    Returns:
+        String - Generated profile in format: ITS_CODE:V2X_PROFILE:HARDWARE_ID:ACCESS_SCOPE
+    """
+    
+    # The random hardware ID is kept out of the cached encoding
+    return encode_prefix(its, v2x_int, access_int).replace('::', f":{_rng().getrandbits(32):08X}:", 1)
 
 # Configure page
 st.set_page_config(
@@ -86,13 +123,6 @@ st.set_page_config(
 st.title("🚗 Vehicle ITS Profile Generator")
 st.markdown("Generate vehicle communication profiles for Intelligent Transportation Systems")
 
-# Your existing data
-its_list = {
-    "Siemens": 1126, "Harman": 2852, "Schneider": 4389, "TATA": 1142, 
-    "UMTC": 5374, "Huawei": 6782, "Kapsch": 3758, "Hitachi": 6820, 
-    "GMV": 9903, "NEC": 1096
-}
-
 # Sidebar for quick info
 st.sidebar.header("ℹ️ About")
 st.sidebar.markdown("""
@@ -105,101 +135,112 @@ This tool generates vehicle communication profiles by:
 ⚠️ **All categories must have selections to generate a profile.**
 """)
 
-# Main content
-col1, col2 = st.columns([1, 1])
+# Main content - all inputs live in a single form so the script only reruns on submit
+with st.form("profile_form", clear_on_submit=False):
+    col1, col2 = st.columns([1, 1])
 
-with col1:
-    # OEM Selection
-    st.subheader("🏢 1. Select ITS Provider")
-    selected_oem = st.selectbox(
-        "Choose provider:",
-        [""] + list(its_list.keys()),  # Add empty option
-        help="Select the ITS (Intelligent Transportation Systems) provider"
-    )
-    
-    # Show validation message for OEM
-    if not selected_oem:
-        st.warning("⚠️ Please select an ITS provider")
+    with col1:
+        # OEM Selection
+        st.subheader("🏢 1. Select ITS Provider")
+        selected_oem = st.selectbox(
+            "Choose provider:",
+            [""] + list(_tables()[0].keys()),  # Add empty option
+            key="selected_oem",
+            help="Select the ITS (Intelligent Transportation Systems) provider"
+        )
     
-    # V2X Modes
-    st.subheader("📡 2. V2X Communication Modes")
-    st.markdown("*Select at least one communication mode*")
+        # V2X Modes
+        st.subheader("📡 2. V2X Communication Modes")
+        st.markdown("*Select at least one communication mode*")
     
-    v2x_col1, v2x_col2 = st.columns(2)
+        v2x_col1, v2x_col2 = st.columns(2)
     
-    with v2x_col1:
-        v2v = st.checkbox("V2V", help="Vehicle-to-Vehicle communication")
-        v2i = st.checkbox("V2I", help="Vehicle-to-Infrastructure communication")
-        v2n = st.checkbox("V2N", help="Vehicle-to-Network communication") 
-        v2p = st.checkbox("V2P", help="Vehicle-to-Pedestrian communication")
+        with v2x_col1:
+            v2v = st.checkbox("V2V", key="v2v", help="Vehicle-to-Vehicle communication")
+            v2i = st.checkbox("V2I", key="v2i", help="Vehicle-to-Infrastructure communication")
+            v2n = st.checkbox("V2N", key="v2n", help="Vehicle-to-Network communication") 
+            v2p = st.checkbox("V2P", key="v2p", help="Vehicle-to-Pedestrian communication")
     
-    with v2x_col2:
-        v2g = st.checkbox("V2G", help="Vehicle-to-Grid communication")
-        v2d = st.checkbox("V2D", help="Vehicle-to-Device communication")
-        v2h = st.checkbox("V2H", help="Vehicle-to-Home communication")
-        res = st.checkbox("RES", help="Reserved for future use")
-    
-    # Check if any V2X mode is selected
-    v2x_selected = any([v2v, v2i, v2n, v2p, v2g, v2d, v2h, res])
-    if not v2x_selected:
-        st.warning("⚠️ Please select at least one V2X communication mode")
+        with v2x_col2:
+            v2g = st.checkbox("V2G", key="v2g", help="Vehicle-to-Grid communication")
+            v2d = st.checkbox("V2D", key="v2d", help="Vehicle-to-Device communication")
+            v2h = st.checkbox("V2H", key="v2h", help="Vehicle-to-Home communication")
+            res = st.checkbox("RES", key="res", help="Reserved for future use")
 
-with col2:
-    # Access Permissions
-    st.subheader("🔐 3. System Access Permissions")
-    st.markdown("*Select at least one access permission*")
+    with col2:
+        # Access Permissions
+        st.subheader("🔐 3. System Access Permissions")
+        st.markdown("*Select at least one access permission*")
     
-    # Create tabs for better organization
-    tab1, tab2, tab3, tab4 = st.tabs(["🔧 Control", "🛡️ Safety", "📱 Media", "⚙️ Services"])
+        # Create tabs for better organization
+        tab1, tab2, tab3, tab4 = st.tabs(["🔧 Control", "🛡️ Safety", "📱 Media", "⚙️ Services"])
     
-    with tab1:
-        st.write("**CAN Bus Operations**")
-        read_can = st.checkbox("Read CAN", help="Read from CAN bus")
-        write_can = st.checkbox("Write CAN", help="Write to CAN bus")
+        with tab1:
+            st.write("**CAN Bus Operations**")
+            read_can = st.checkbox("Read CAN", key="read_can", help="Read from CAN bus")
+            write_can = st.checkbox("Write CAN", key="write_can", help="Write to CAN bus")
         
-        st.write("**Vehicle Control Systems**")
-        brake_ctrl = st.checkbox("Brake Control", help="Control braking systems")
-        steer_ctrl = st.checkbox("Steering Control", help="Control steering systems")
-        powertrain_ctrl = st.checkbox("Powertrain Control", help="Control engine/motor systems")
-
-    with tab2:
-        st.write("**Safety Systems**")
-        adas_alerts = st.checkbox("ADAS Alerts", help="Advanced Driver Assistance Systems alerts")
-        sensor_feed = st.checkbox("Sensor Feed", help="Access to sensor data feeds")
-
-    with tab3:
-        st.write("**Media & Display**")
-        video_stream = st.checkbox("Video Stream", help="Access to video streaming")
-        audio_stream = st.checkbox("Audio Stream", help="Access to audio streaming")
-        nav_display = st.checkbox("Navigation Display", help="Control navigation display")
-        hmi_notif = st.checkbox("HMI Notifications", help="Human-Machine Interface notifications")
-
-    with tab4:
-        st.write("**Vehicle Services**")
-        telemetry_tx = st.checkbox("Telemetry TX", help="Transmit telemetry data")
-        ota_update = st.checkbox("OTA Updates", help="Over-The-Air software updates")
-        diagnostics = st.checkbox("Diagnostics", help="Vehicle diagnostic access")
-        hvac_ctrl = st.checkbox("HVAC Control", help="Climate control systems")
-        lights_ctrl = st.checkbox("Lights Control", help="Vehicle lighting control")
-    
-    # Check if any access permission is selected
-    access_selected = any([
-        read_can, write_can, brake_ctrl, steer_ctrl, powertrain_ctrl,
-        adas_alerts, sensor_feed, video_stream, audio_stream, nav_display,
-        hmi_notif, telemetry_tx, ota_update, diagnostics, hvac_ctrl, lights_ctrl
-    ])
-    
-    if not access_selected:
-        st.warning("⚠️ Please select at least one system access permission")
+            st.write("**Vehicle Control Systems**")
+            brake_ctrl = st.checkbox("Brake Control", key="brake_ctrl", help="Control braking systems")
+            steer_ctrl = st.checkbox("Steering Control", key="steer_ctrl", help="Control steering systems")
+            powertrain_ctrl = st.checkbox("Powertrain Control", key="powertrain_ctrl", help="Control engine/motor systems")
+
+        with tab2:
+            st.write("**Safety Systems**")
+            adas_alerts = st.checkbox("ADAS Alerts", key="adas_alerts", help="Advanced Driver Assistance Systems alerts")
+            sensor_feed = st.checkbox("Sensor Feed", key="sensor_feed", help="Access to sensor data feeds")
+
+        with tab3:
+            st.write("**Media & Display**")
+            video_stream = st.checkbox("Video Stream", key="video_stream", help="Access to video streaming")
+            audio_stream = st.checkbox("Audio Stream", key="audio_stream", help="Access to audio streaming")
+            nav_display = st.checkbox("Navigation Display", key="nav_display", help="Control navigation display")
+            hmi_notif = st.checkbox("HMI Notifications", key="hmi_notif", help="Human-Machine Interface notifications")
+
+        with tab4:
+            st.write("**Vehicle Services**")
+            telemetry_tx = st.checkbox("Telemetry TX", key="telemetry_tx", help="Transmit telemetry data")
+            ota_update = st.checkbox("OTA Updates", key="ota_update", help="Over-The-Air software updates")
+            diagnostics = st.checkbox("Diagnostics", key="diagnostics", help="Vehicle diagnostic access")
+            hvac_ctrl = st.checkbox("HVAC Control", key="hvac_ctrl", help="Climate control systems")
+            lights_ctrl = st.checkbox("Lights Control", key="lights_ctrl", help="Vehicle lighting control")
+
+    # Generate Profile Section
+    st.subheader("🔧 4. Generate Profile")
+
+    col1, col2, col3 = st.columns([1, 1, 1])
+    with col2:
+        submitted = st.form_submit_button(
+            "🚀 Generate Profile",
+            type="primary",
+            width="stretch",
+            help="Generate your vehicle profile"
+        )
 
-# Generate Profile Section
-st.subheader("🔧 4. Generate Profile")
+# Fold the selections into the profile bitmasks (widget values only update on submit)
+# Widget values are listed in V2X_NAMES / ACCESS_NAMES order; bit position 0 is the most significant bit
+V2X_BITS, ACCESS_BITS = _tables()[1:]
+
+v2x_int = 0
+for mode_name, is_enabled in zip(V2X_NAMES, (v2v, v2i, v2n, v2p, v2g, v2d, v2h, res)):
+    if is_enabled:
+        v2x_int |= 1 << (7 - V2X_BITS[mode_name])
+
+access_int = 0
+for mode_name, is_enabled in zip(ACCESS_NAMES, (
+    read_can, write_can, brake_ctrl, steer_ctrl, powertrain_ctrl,
+    adas_alerts, sensor_feed, video_stream, audio_stream, nav_display,
+    hmi_notif, telemetry_tx, ota_update, diagnostics, hvac_ctrl, lights_ctrl
+)):
+    if is_enabled:
+        access_int |= 1 << (15 - ACCESS_BITS[mode_name])
 
 # Validation check
+v2x_selected = v2x_int != 0
+access_selected = access_int != 0
 all_requirements_met = selected_oem and v2x_selected and access_selected
 
-# Show overall validation status
-if not all_requirements_met:
+if submitted and not all_requirements_met:
     st.error("❌ **Cannot generate profile:** Please complete all required selections above")
     
     missing_items = []
@@ -213,66 +254,20 @@ if not all_requirements_met:
     st.markdown("**Missing selections:**")
     for item in missing_items:
         st.markdown(item)
-else:
-    st.success("✅ All requirements met. Ready to generate profile!")
-
-col1, col2, col3 = st.columns([1, 1, 1])
-with col2:
-    # Disable button if requirements not met
-    generate_button = st.button(
-        "🚀 Generate Profile", 
-        type="primary", 
-        use_container_width=True,
-        disabled=not all_requirements_met,
-        help="Complete all required selections to enable profile generation" if not all_requirements_met else "Generate your vehicle profile"
-    )
-
-# Only proceed if button clicked and all requirements met
-if generate_button and all_requirements_met:
+
+# Only proceed if form submitted and all requirements met
+if submitted and all_requirements_met:
     with st.spinner('Generating profile...'):
         try:
-            # Build mode dictionaries instead of subprocess arguments
-            v2x_modes_dict = {
-                "V2V": v2v,
-                "V2I": v2i, 
-                "V2N": v2n,
-                "V2P": v2p,
-                "V2G": v2g,
-                "V2D": v2d,
-                "V2H": v2h,
-                "RES": res
-            }
-            
-            access_modes_dict = {
-                "READ_CAN": read_can,
-                "WRITE_CAN": write_can,
-                "BRAKE_CTRL": brake_ctrl,
-                "STEER_CTRL": steer_ctrl,
-                "POWERTRAIN_CTRL": powertrain_ctrl,
-                "ADAS_ALERTS": adas_alerts,
-                "SENSOR_FEED": sensor_feed,
-                "VIDEO_STREAM": video_stream,
-                "AUDIO_STREAM": audio_stream,
-                "NAV_DISPLAY": nav_display,
-                "HMI_NOTIF": hmi_notif,
-                "TELEMETRY_TX": telemetry_tx,
-                "OTA_UPDATE": ota_update,
-                "DIAGNOSTICS": diagnostics,
-                "HVAC_CTRL": hvac_ctrl,
-                "LIGHTS_CTRL": lights_ctrl
-            }
-            
             # Call the function directly - no subprocess needed!
-            profile = generate_profile(selected_oem, v2x_modes_dict, access_modes_dict)
+            profile = generate_profile(selected_oem, v2x_int, access_int)
             
             # ADD TO HISTORY HERE - profile is now defined and in scope!
-            st.session_state.profile_history.append({
-                'timestamp': datetime.now(),
-                'oem': selected_oem,
-                'profile': profile,
-                'v2x_modes': [mode for mode, enabled in v2x_modes_dict.items() if enabled],
-                'access_modes': [mode for mode, enabled in access_modes_dict.items() if enabled]
-            })
+            st.session_state.hist_ts.append(datetime.now())
+            st.session_state.hist_oem.append(selected_oem)
+            st.session_state.hist_profile.append(profile)
+            st.session_state.hist_v2x_mask.append(v2x_int)
+            st.session_state.hist_access_mask.append(access_int)
             
             st.success("✅ Profile Generated Successfully!")
             
@@ -320,9 +315,11 @@ if generate_button and all_requirements_met:
                 
                 summary_col1, summary_col2 = st.columns(2)
                 
+                V2X_EXPANSION, ACCESS_HI_EXPANSION, ACCESS_LO_EXPANSION = _expansions()
+                
                 with summary_col1:
                     st.write("**Active V2X Modes:**")
-                    active_v2x = [mode for mode, enabled in v2x_modes_dict.items() if enabled]
+                    active_v2x = V2X_EXPANSION[v2x_int]
                     
                     if active_v2x:
                         for mode in active_v2x:
@@ -332,7 +329,7 @@ if generate_button and all_requirements_met:
                 
                 with summary_col2:
                     st.write("**Active Access Permissions:**")
-                    active_access = [mode for mode, enabled in access_modes_dict.items() if enabled]
+                    active_access = ACCESS_HI_EXPANSION[access_int >> 8] + ACCESS_LO_EXPANSION[access_int & 0xFF]
                     
                     if active_access:
                         for access in active_access:
@@ -346,63 +343,88 @@ if generate_button and all_requirements_met:
             st.error(f"❌ Error generating profile: {str(e)}")
             st.write(f"Error details: {type(e).__name__}")
 
-elif generate_button and not all_requirements_met:
-    # This should not happen due to disabled button, but just in case
-    st.error("❌ Please complete all required selections before generating the profile.")
+def set_modes(names, value):
+    """
+    Tick or untick the checkboxes for the given mode names (checkbox keys are the lower-cased names)
+    
+    Args:
+        names: Tuple - Mode names, e.g. V2X_NAMES or ACCESS_NAMES
+        value: Boolean - New checkbox state
+    """
+    for name in names:
+        st.session_state[name.lower()] = value
+
+def clear_selections():
+    """
+    Reset the provider and every V2X / access checkbox
+    """
+    st.session_state.selected_oem = ""
+    set_modes(V2X_NAMES + ACCESS_NAMES, False)
 
-# Add a "Quick Select All" option
+# Add a "Quick Select All" option - callbacks run before the rerun, so the form picks up the new state
 st.subheader("⚡ Quick Actions")
 quick_col1, quick_col2, quick_col3 = st.columns(3)
 
 with quick_col1:
-    if st.button("✅ Select All V2X Modes"):
-        st.rerun()
+    st.button("✅ Select All V2X Modes", on_click=set_modes, args=(V2X_NAMES, True))
 
 with quick_col2:
-    if st.button("✅ Select All Access Permissions"):
-        st.rerun()
+    st.button("✅ Select All Access Permissions", on_click=set_modes, args=(ACCESS_NAMES, True))
 
 with quick_col3:
-    if st.button("🔄 Clear All Selections"):
-        st.rerun()
+    st.button("🔄 Clear All Selections", on_click=clear_selections)
 
-# Profile History Section
-if st.session_state.profile_history:
-    st.subheader("📚 Profile History")
+# Profile History Section - rendered in a fragment so its widgets only rerun this block
+@st.fragment
+def render_history():
+    """
+    Render the profile history expander and its clear button
+    """
     
-    # Show total count
-    st.write(f"**Total profiles generated:** {len(st.session_state.profile_history)}")
+    history_count = len(st.session_state.hist_profile)
     
-    # Display recent profiles in an expander
-    with st.expander(f"View {len(st.session_state.profile_history)} generated profiles"):
-        for i, entry in enumerate(reversed(st.session_state.profile_history)):
-            col1, col2, col3 = st.columns([2, 3, 1])
-            
-            with col1:
-                st.write(f"**{entry['timestamp'].strftime('%H:%M:%S')}**")
-                st.write(f"Provider: {entry['oem']}")
-            
-            with col2:
-                st.code(entry['profile'], language=None)
-            
-            with col3:
-                # Add download button for individual profiles
-                st.download_button(
-                    label="💾",
-                    data=entry['profile'],
-                    file_name=f"profile_{entry['oem']}_{entry['timestamp'].strftime('%H%M%S')}.txt",
-                    mime="text/plain",
-                    key=f"download_{i}",
-                    help="Download this profile"
-                )
-            
-            if i < len(st.session_state.profile_history) - 1:
-                st.divider()
+    if history_count:
+        st.subheader("📚 Profile History")
+    
+        # Show total count
+        st.write(f"**Total profiles generated:** {history_count}")
+    
+        # Rebuild the mode names from the stored masks
+        V2X_EXPANSION, ACCESS_HI_EXPANSION, ACCESS_LO_EXPANSION = _expansions()
+        v2x_modes = [", ".join(V2X_EXPANSION[mask]) for mask in st.session_state.hist_v2x_mask]
+        access_modes = [
+            ", ".join(ACCESS_HI_EXPANSION[mask >> 8] + ACCESS_LO_EXPANSION[mask & 0xFF])
+            for mask in st.session_state.hist_access_mask
+        ]
     
-    # Clear history button
-    if st.button("🗑️ Clear Profile History", type="secondary"):
-        st.session_state.profile_history = []
-        st.rerun()
+        # Newest profiles first, rendered as a single table
+        history_df = pd.DataFrame({
+            'time': [timestamp.strftime('%H:%M:%S') for timestamp in st.session_state.hist_ts],
+            'oem': st.session_state.hist_oem,
+            'profile': st.session_state.hist_profile,
+            'v2x_modes': v2x_modes,
+            'access_modes': access_modes
+        }).iloc[::-1]
+    
+        # Display recent profiles in an expander
+        with st.expander(f"View {history_count} generated profiles"):
+            st.dataframe(history_df, width="stretch", hide_index=True)
+    
+            st.download_button(
+                label="💾 Download all",
+                data=history_df.to_csv(index=False).encode(),
+                file_name="profiles.csv",
+                mime="text/csv",
+                help="Download all generated profiles as CSV"
+            )
+    
+        # Clear history button
+        if st.button("🗑️ Clear Profile History", type="secondary"):
+            for key in HISTORY_KEYS:
+                st.session_state[key] = []
+            st.rerun(scope="fragment")
+
+render_history()
 
 # Footer
 st.markdown("---")